@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useMemo, lazy, Suspense } from 'react';
 import { AgGridReact } from 'ag-grid-react';
 import { ModuleRegistry, AllCommunityModule } from 'ag-grid-community';
 import { useBusinessData } from './hooks/useBusinessData';
@@ -29,28 +29,55 @@ import {
   Avatar,
   Autocomplete
 } from '@mui/material';
-import { MapContainer, TileLayer, Marker, Popup } from 'react-leaflet';
 import { BarChart, Bar, XAxis, YAxis, CartesianGrid, Tooltip, ResponsiveContainer, PieChart, Pie, Cell } from 'recharts';
-import L from 'leaflet';
 
 import "ag-grid-community/styles/ag-theme-quartz.css";
-import 'leaflet/dist/leaflet.css';
 import './App.css';
 
-// Fix leaflet default markers
-delete L.Icon.Default.prototype._getIconUrl;
-L.Icon.Default.mergeOptions({
-  iconRetinaUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.7.1/images/marker-icon-2x.png',
-  iconUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.7.1/images/marker-icon.png',
-  shadowUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.7.1/images/marker-shadow.png',
-});
+// Leaflet is only needed in the business detail dialog, so it is split into its own chunk
+const BusinessMap = lazy(() => import('./components/BusinessMap'));
 
 ModuleRegistry.registerModules([AllCommunityModule]);
 
+const COLORS = {
+  HIGH: '#ff5252',
+  MEDIUM: '#ffc107',
+  LOW: '#4caf50'
+};
+
+// business_category values counted in the category metric cards
+const CATEGORY_METRICS = {
+  'Eatery Joints': 'eateryJoints',
+  'Retail and Wholesale Shops': 'retailWholesale',
+  'Health Care': 'healthCare',
+  'Education': 'education',
+  'Cooperative and Municipal Organization': 'cooperative'
+};
+
+// Grid options that never change, kept stable so the grid isn't reconfigured on every render
+const DEFAULT_COL_DEF = {
+  sortable: true,
+  filter: true,
+  resizable: true
+};
+const PAGE_SIZE_OPTIONS = [20, 50, 100];
+const ROW_SELECTION = {
+  mode: 'multiRow',
+  enableClickSelection: false
+};
+
+// Priority chip styles, built once rather than for every rendered cell
+const PRIORITY_CHIP_STYLES = Object.fromEntries(
+  Object.entries(COLORS).map(([priority, color]) => [priority, {
+    backgroundColor: color,
+    color: priority === 'MEDIUM' ? 'black' : 'white',
+    fontWeight: 'bold'
+  }])
+);
+
 function App() {
   const { user, loading: authLoading, signOut } = useAuth();
   const { allData, loading, error, updateContactStatus } = useBusinessData();
-  const [filteredData, setFilteredData] = useState([]);
   const [searchTerm, setSearchTerm] = useState('');
   const [selectedBorough, setSelectedBorough] = useState('All');
   const [selectedPostcode, setSelectedPostcode] = useState('All');
@@ -59,18 +86,12 @@ function App() {
   const [selectedCategory, setSelectedCategory] = useState('All');
   const [selectedBusiness, setSelectedBusiness] = useState(null);
   const [businessDetailOpen, setBusinessDetailOpen] = useState(false);
-  const [searchSuggestions, setSearchSuggestions] = useState([]);
   const [contactDialogOpen, setContactDialogOpen] = useState(false);
   const [contactingBusiness, setContactingBusiness] = useState(null);
   const [contactNotes, setContactNotes] = useState('');
 
-  const COLORS = {
-    HIGH: '#ff5252',
-    MEDIUM: '#ffc107',
-    LOW: '#4caf50'
-  };
-
-  const columnDefs = [
+  // Column definitions only use state setters, so they are built once instead of every render
+  const columnDefs = useMemo(() => [
     { 
       headerName: "Business Name", 
       field: "Business Name", 
@@ -109,11 +130,7 @@ function App() {
         <Chip 
           label={params.value} 
           size="small"
-          style={{ 
-            backgroundColor: COLORS[params.value], 
-            color: params.value === 'MEDIUM' ? 'black' : 'white',
-            fontWeight: 'bold'
-          }}
+          style={PRIORITY_CHIP_STYLES[params.value]}
         />
       )
     },
@@ -171,93 +188,97 @@ function App() {
         </Button>
       )
     },
-  ];
-
-  useEffect(() => {
-    //initialize search suggestions when data loads
-    setSearchSuggestions(allData.map(business => ({
-      label: business['Business Name'],
-      data: business
-    })));
-  }, [allData]);
-
-  useEffect(() => {
-    let filtered = allData;
-
-    if (searchTerm) {
-      filtered = filtered.filter(business => 
-        business['Business Name']?.toLowerCase().includes(searchTerm.toLowerCase()) ||
-        business['Address']?.toLowerCase().includes(searchTerm.toLowerCase())
-      );
-    }
-
-    if (selectedBorough !== 'All') {
-      filtered = filtered.filter(business => business.Borough === selectedBorough);
-    }
-
-    if (selectedPostcode !== 'All') {
-      filtered = filtered.filter(business => business.Postcode === selectedPostcode);
-    }
-
-    if (selectedLeadType !== 'All') {
-      filtered = filtered.filter(business => business['Lead Type'] === selectedLeadType);
+  ], []);
+
+  //search suggestions, rebuilt only when the data changes
+  const searchSuggestions = useMemo(() => allData.map(business => ({
+    label: business['Business Name'],
+    data: business
+  })), [allData]);
+
+  // Lowercased "name + address" per business, rebuilt only when the data changes
+  const searchIndex = useMemo(() => allData.map(business =>
+    `${business['Business Name'] ?? ''}\u001f${business['Address'] ?? ''}`.toLowerCase()
+  ), [allData]);
+
+  // All filters applied in one pass; recomputed only when the data or a filter changes
+  const filteredData = useMemo(() => {
+    const term = searchTerm.toLowerCase();
+    if (!term && selectedBorough === 'All' && selectedPostcode === 'All' && selectedLeadType === 'All'
+      && selectedPriority === 'All' && selectedCategory === 'All') {
+      return allData;
     }
 
-    if (selectedPriority !== 'All') {
-      filtered = filtered.filter(business => business.Priority === selectedPriority);
-    }
-
-    if (selectedCategory !== 'All') {
-      filtered = filtered.filter(business => business.business_category === selectedCategory);
+    return allData.filter((business, index) =>
+      (!term || searchIndex[index].includes(term)) &&
+      (selectedBorough === 'All' || business.Borough === selectedBorough) &&
+      (selectedPostcode === 'All' || business.Postcode === selectedPostcode) &&
+      (selectedLeadType === 'All' || business['Lead Type'] === selectedLeadType) &&
+      (selectedPriority === 'All' || business.Priority === selectedPriority) &&
+      (selectedCategory === 'All' || business.business_category === selectedCategory)
+    );
+  }, [allData, searchIndex, searchTerm, selectedBorough, selectedPostcode, selectedLeadType, selectedPriority, selectedCategory]);
+
+  // Metric and chart counts, gathered in one pass over the filtered rows
+  const { metrics, chartData } = useMemo(() => {
+    const metrics = {
+      total: filteredData.length,
+      highPriority: 0,
+      mediumPriority: 0,
+      lowPriority: 0,
+      withPhone: 0,
+      withWebsite: 0,
+      eateryJoints: 0,
+      retailWholesale: 0,
+      healthCare: 0,
+      education: 0,
+      cooperative: 0
+    };
+    const boroughCounts = new Map();
+
+    for (const b of filteredData) {
+      if (b.Priority === 'HIGH') metrics.highPriority++;
+      else if (b.Priority === 'MEDIUM') metrics.mediumPriority++;
+      else if (b.Priority === 'LOW') metrics.lowPriority++;
+      if (b.Phone) metrics.withPhone++;
+      if (b.Website) metrics.withWebsite++;
+      const categoryMetric = CATEGORY_METRICS[b.business_category];
+      if (categoryMetric) metrics[categoryMetric]++;
+      boroughCounts.set(b.Borough, (boroughCounts.get(b.Borough) || 0) + 1);
     }
 
-    setFilteredData(filtered);
-  }, [allData, searchTerm, selectedBorough, selectedPostcode, selectedLeadType, selectedPriority, selectedCategory]);
-
-  const getMetrics = () => {
-    const total = filteredData.length;
-    const highPriority = filteredData.filter(b => b.Priority === 'HIGH').length;
-    const mediumPriority = filteredData.filter(b => b.Priority === 'MEDIUM').length;
-    const lowPriority = filteredData.filter(b => b.Priority === 'LOW').length;
-    const withPhone = filteredData.filter(b => b.Phone).length;
-    const withWebsite = filteredData.filter(b => b.Website).length;
-    
-    const eateryJoints = filteredData.filter(b => b.business_category === 'Eatery Joints').length;
-    const retailWholesale = filteredData.filter(b => b.business_category === 'Retail and Wholesale Shops').length;
-    const healthCare = filteredData.filter(b => b.business_category === 'Health Care').length;
-    const education = filteredData.filter(b => b.business_category === 'Education').length;
-    const cooperative = filteredData.filter(b => b.business_category === 'Cooperative and Municipal Organization').length;
-    
-    return { total, highPriority, mediumPriority, lowPriority, withPhone, withWebsite, eateryJoints, retailWholesale, healthCare, education, cooperative };
-  };
-
-  const getChartData = () => {
     const priorityData = [
-      { name: 'High Priority', value: filteredData.filter(b => b.Priority === 'HIGH').length, color: COLORS.HIGH },
-      { name: 'Medium Priority', value: filteredData.filter(b => b.Priority === 'MEDIUM').length, color: COLORS.MEDIUM },
-      { name: 'Low Priority', value: filteredData.filter(b => b.Priority === 'LOW').length, color: COLORS.LOW }
+      { name: 'High Priority', value: metrics.highPriority, color: COLORS.HIGH },
+      { name: 'Medium Priority', value: metrics.mediumPriority, color: COLORS.MEDIUM },
+      { name: 'Low Priority', value: metrics.lowPriority, color: COLORS.LOW }
     ];
+    const boroughData = [...boroughCounts].map(([name, count]) => ({ name, count }));
+
+    return { metrics, chartData: { priorityData, boroughData } };
+  }, [filteredData]);
+
+  // Dropdown options and the borough -> postcodes drill-down, built once per data load
+  const filterOptions = useMemo(() => {
+    const sortedValues = values => [...values].filter(Boolean).sort();
+    const postcodesByBorough = new Map();
+    for (const item of allData) {
+      if (!postcodesByBorough.has(item.Borough)) postcodesByBorough.set(item.Borough, new Set());
+      postcodesByBorough.get(item.Borough).add(item.Postcode);
+    }
 
-    const boroughData = [...new Set(filteredData.map(b => b.Borough))].map(borough => ({
-      name: borough,
-      count: filteredData.filter(b => b.Borough === borough).length
-    }));
-
-    return { priorityData, boroughData };
-  };
-
-  const getUniqueValues = (field) => {
-    return [...new Set(allData.map(item => item[field]))].filter(Boolean).sort();
-  };
+    return {
+      boroughs: sortedValues(postcodesByBorough.keys()),
+      postcodes: sortedValues(new Set(allData.map(item => item.Postcode))),
+      leadTypes: sortedValues(new Set(allData.map(item => item['Lead Type']))),
+      postcodesByBorough: new Map(
+        [...postcodesByBorough].map(([borough, postcodes]) => [borough, sortedValues(postcodes)])
+      )
+    };
+  }, [allData]);
 
-  const getFilteredPostcodes = () => {
-    if (selectedBorough === 'All') {
-      return getUniqueValues('Postcode');
-    }
-    // Filter postcodes by selected borough
-    const boroughBusinesses = allData.filter(item => item.Borough === selectedBorough);
-    return [...new Set(boroughBusinesses.map(item => item.Postcode))].filter(Boolean).sort();
-  };
+  const boroughPostcodes = selectedBorough === 'All'
+    ? filterOptions.postcodes
+    : filterOptions.postcodesByBorough.get(selectedBorough) ?? [];
 
   const clearFilters = () => {
     setSearchTerm('');
@@ -295,14 +316,6 @@ function App() {
     }
   };
 
-  // Get default map center (London)
-  const mapCenter = selectedBusiness?.Latitude && selectedBusiness?.Longitude 
-    ? [parseFloat(selectedBusiness.Latitude), parseFloat(selectedBusiness.Longitude)]
-    : [51.5074, -0.1278];
-
-  const metrics = getMetrics();
-  const chartData = getChartData();
-
   //show loading while auth is initializing
   if (authLoading) {
     return (
@@ -677,7 +690,7 @@ function App() {
                     label="Borough"
                   >
                     <MenuItem value="All">All</MenuItem>
-                    {getUniqueValues('Borough').map(borough => (
+                    {filterOptions.boroughs.map(borough => (
                       <MenuItem key={borough} value={borough}>{borough}</MenuItem>
                     ))}
                   </Select>
@@ -692,7 +705,7 @@ function App() {
                     label="Postcode"
                   >
                     <MenuItem value="All">All</MenuItem>
-                    {getFilteredPostcodes().map(postcode => (
+                    {boroughPostcodes.map(postcode => (
                       <MenuItem key={postcode} value={postcode}>{postcode}</MenuItem>
                     ))}
                   </Select>
@@ -707,7 +720,7 @@ function App() {
                     label="Lead Type"
                   >
                     <MenuItem value="All">All</MenuItem>
-                    {getUniqueValues('Lead Type').map(type => (
+                    {filterOptions.leadTypes.map(type => (
                       <MenuItem key={type} value={type}>{type}</MenuItem>
                     ))}
                   </Select>
@@ -774,21 +787,13 @@ function App() {
               }}
             >
               <AgGridReact
-                key={`grid-${filteredData.length}-${JSON.stringify(filteredData.slice(0,1))}`}
                 rowData={filteredData}
                 columnDefs={columnDefs}
-                defaultColDef={{
-                  sortable: true,
-                  filter: true,
-                  resizable: true
-                }}
+                defaultColDef={DEFAULT_COL_DEF}
                 pagination={true}
                 paginationPageSize={20}
-                paginationPageSizeSelector={[20, 50, 100]}
-                rowSelection={{
-                  mode: 'multiRow',
-                  enableClickSelection: false
-                }}
+                paginationPageSizeSelector={PAGE_SIZE_OPTIONS}
+                rowSelection={ROW_SELECTION}
                 animateRows={true}
               />
       </div>
@@ -854,22 +859,11 @@ function App() {
               <Typography variant="subtitle1" fontWeight="bold" gutterBottom>Location</Typography>
               <Box sx={{ height: 300, width: '100%', bgcolor: '#f5f5f5', display: 'flex', alignItems: 'center', justifyContent: 'center' }}>
                 {selectedBusiness?.Latitude && selectedBusiness?.Longitude ? (
-                  <MapContainer 
-                    center={mapCenter} 
-                    zoom={15} 
-                    style={{ height: '100%', width: '100%' }}
-                  >
-                    <TileLayer
-                      url="https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png"
-                      attribution='&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
-                    />
-                    <Marker position={mapCenter}>
-                      <Popup>
-                        <strong>{selectedBusiness['Business Name']}</strong><br />
-                        {selectedBusiness.Address}
-                      </Popup>
-                    </Marker>
-                  </MapContainer>
+                  <Suspense fallback={
+                    <Typography variant="body2" color="text.secondary">Loading map...</Typography>
+                  }>
+                    <BusinessMap business={selectedBusiness} />
+                  </Suspense>
                 ) : (
                   <Typography variant="body2" color="text.secondary">
                     📍 Location coordinates not available
@@ -0,0 +1,35 @@
+import { MapContainer, TileLayer, Marker, Popup } from 'react-leaflet'
+import L from 'leaflet'
+
+import 'leaflet/dist/leaflet.css'
+
+// Fix leaflet default markers
+delete L.Icon.Default.prototype._getIconUrl
+L.Icon.Default.mergeOptions({
+  iconRetinaUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.7.1/images/marker-icon-2x.png',
+  iconUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.7.1/images/marker-icon.png',
+  shadowUrl: 'https://cdnjs.cloudflare.com/ajax/libs/leaflet/1.7.1/images/marker-shadow.png',
+})
+
+export default function BusinessMap({ business }) {
+  const position = [parseFloat(business.Latitude), parseFloat(business.Longitude)]
+
+  return (
+    <MapContainer 
+      center={position} 
+      zoom={15} 
+      style={{ height: '100%', width: '100%' }}
+    >
+      <TileLayer
+        url="https://{s}.tile.openstreetmap.org/{z}/{x}/{y}.png"
+        attribution='&copy; <a href="https://www.openstreetmap.org/copyright">OpenStreetMap</a> contributors'
+      />
+      <Marker position={position}>
+        <Popup>
+          <strong>{business['Business Name']}</strong><br />
+          {business.Address}
+        </Popup>
+      </Marker>
+    </MapContainer>
+  )
+}
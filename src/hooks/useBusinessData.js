@@ -47,7 +47,7 @@ export function useBusinessData() {
 
   const updateContactStatus = async (businessName, contacted, contactNotes) => {
     try {
-      const { error } = await supabase
+      const { data, error } = await supabase
         .from('businesses')
         .update({
           contacted,
@@ -56,11 +56,21 @@ export function useBusinessData() {
           updated_at: new Date().toISOString()
         })
         .eq('business_name', businessName)
+        .select('business_name, contacted, contact_date, contact_notes')
 
       if (error) throw error
 
-      //refresh data after update
-      await fetchBusinesses()
+      //patch the updated rows in place instead of refetching every business
+      const updatedRows = new Map(data.map(row => [row.business_name, row]))
+      setAllData(prev => prev.map(business => {
+        const row = updatedRows.get(business['Business Name'])
+        return row ? {
+          ...business,
+          'Contacted': row.contacted,
+          'Contact_Date': row.contact_date,
+          'Contact_Notes': row.contact_notes
+        } : business
+      }))
       return true
     } catch (err) {
       console.error('Error updating contact status:', err)
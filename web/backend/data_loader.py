@@ -1,114 +1,415 @@
+from concurrent.futures import ThreadPoolExecutor
+import copy
+import csv
+import fnmatch
+import hashlib
+import os
+import re
+import shutil
+import sqlite3
+import threading
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from pyarrow import csv as pacsv
+import pyarrow.parquet as pq
+from contextlib import closing
 from pathlib import Path
-import re
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+# Upper bound on threads used to read the business files
+CSV_READ_WORKERS = 8
+
+# Last load_and_clean_data() result: (business files signature, contacts database signature,
+# deduplicated records before contact statuses are applied, records served)
+_records_cache: Tuple[Optional[tuple], Optional[tuple], List[dict], List[dict]] = (None, None, [], [])
+_records_lock = threading.Lock()
+
+# Business CSVs under the data directory, with the mtime of every directory walked to find them
+_business_files_cache: Tuple[Optional[List[Tuple[str, int]]], List[Path]] = (None, [])
+
+# Contact status per business name (SQLite, WAL mode); overrides the CSV contact columns
+# Kept in its own directory, which the business file walk skips: SQLite creates and removes
+# the -wal/-shm files next to it on every connection, changing that directory's mtime
+CONTACTS_DB = Path(__file__).parent.parent.parent / 'data' / 'contacts' / 'contacts.db'
+
+# Parquet copies of the CSVs, refreshed whenever the CSV is newer than its copy
+PARQUET_CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / '.parquet_cache'
+
+# The columns the extractors write, with explicit Arrow types so the CSV reader
+# doesn't have to infer them file by file. Only these columns are read (in this
+# order); any that a file lacks are skipped.
+CSV_COLUMN_TYPES = {
+    'Priority': pa.string(),
+    'Spice Priority': pa.string(),
+    'Oil Priority': pa.string(),
+    'Lead Type': pa.string(),
+    'Business Name': pa.string(),
+    'Cuisine Type': pa.string(),
+    'Address': pa.string(),
+    'Postcode': pa.string(),
+    'Phone': pa.string(),
+    'Website': pa.string(),
+    'Latitude': pa.float64(),
+    'Longitude': pa.float64(),
+    'Source': pa.string(),
+    'Contacted': pa.bool_(),
+    'Contact_Date': pa.string(),
+    'Contact_Notes': pa.string(),
+    'Borough': pa.string(),
+    'Email': pa.string(),
+    'Rating': pa.float64(),
+    'Price Level': pa.string(),  # '£'..'££££' from the spice extractors
+    'Reviews Count': pa.float64(),
+}
+
+
+PRIORITY_DTYPE = pd.CategoricalDtype(['HIGH', 'MEDIUM', 'LOW'], ordered=True)
+
+# Business name endings ignored when matching duplicates, removed in this order
+NAME_SUFFIXES = [' ltd', ' limited', ' restaurant', ' cafe', ' takeaway', ' kitchen', ' grill']
+
+# Bump when a loading or deduplication change alters what the Parquet caches hold.
+# Changes to the constants above are picked up through CACHE_KEY without a bump.
+CACHE_FORMAT_VERSION = 3
+CACHE_KEY = hashlib.sha1(
+    repr((CACHE_FORMAT_VERSION, CSV_COLUMN_TYPES, PRIORITY_DTYPE, NAME_SUFFIXES)).encode()
+).hexdigest()[:16]
+
+
+def _read_business_table(file: Path, data_dir: Path, convert_options: pacsv.ConvertOptions) -> pa.Table:
+    """Read a business CSV, going through its Parquet copy when that is up to date."""
+    cached = PARQUET_CACHE_DIR / CACHE_KEY / file.relative_to(data_dir).with_suffix('.parquet')
+    try:
+        if cached.stat().st_mtime >= file.stat().st_mtime:
+            table = pq.read_table(cached)
+            return table.select([name for name in CSV_COLUMN_TYPES if name in table.column_names])
+    except OSError:
+        pass
+
+    # Only parse the known columns this file actually has
+    with open(file, newline='', encoding='utf-8-sig') as f:
+        header = next(csv.reader(f), [])
+    convert_options = copy.copy(convert_options)
+    convert_options.include_columns = [name for name in CSV_COLUMN_TYPES if name in header]
+
+    table = pacsv.read_csv(file, convert_options=convert_options)
+    _write_parquet_cache(table, cached)
+    return table
+
+
+def _write_parquet_cache(table: pa.Table, path: Path) -> None:
+    """Write a cache file atomically; the cache is optional, so write errors are ignored."""
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix('.tmp')
+        pq.write_table(table, tmp, compression='zstd')
+        tmp.replace(path)
+    except OSError:
+        pass
+
+
+def _with_constant_column(table: pa.Table, name: str, value: str, categorical: bool = False) -> pa.Table:
+    """Set (or add) a column holding the same string on every row.
+
+    With categorical=True the column is dictionary-encoded, which to_pandas() turns
+    straight into a pandas categorical.
+    """
+    if categorical:
+        indices = pa.array(np.zeros(table.num_rows, dtype=np.int32))
+        column = pa.DictionaryArray.from_arrays(indices, pa.array([value], pa.string()))
+    else:
+        column = pa.array([value] * table.num_rows, pa.string())
+    index = table.schema.get_field_index(name)
+    if index >= 0:
+        return table.set_column(index, name, column)
+    return table.append_column(name, column)
+
+
+def get_borough_from_path(file_path: Path) -> str:
+    """Extract borough name from file path dynamically."""
+    borough_folder = file_path.parent.name
+    
+    
+    borough_name = borough_folder.replace('_', ' ').title()
+    
+    # Handle special cases for better display
+    if 'hammersmith' in borough_folder.lower():
+        return 'Hammersmith & Fulham'
+    elif 'richmond' in borough_folder.lower():
+        return 'Richmond upon Thames'
+    elif 'kingston' in borough_folder.lower():
+        return 'Kingston upon Thames'
+    
+    return borough_name
+
+
+def _load_business_file(file: Path, data_dir: Path, convert_options: pacsv.ConvertOptions) -> Optional[pa.Table]:
+    """Read one business file and standardize its Lead Type, Priority and Borough columns."""
+    try:
+        table = _read_business_table(file, data_dir, convert_options)
+
+        # Classify the file once, then attach the literal columns
+        stem = file.stem.lower()
+        if 'spice' in stem:
+            lead_type, priority_columns = 'Spice', ['Spice Priority']
+        elif 'oil' in stem:
+            lead_type, priority_columns = 'Cooking Oil', ['Oil Priority']
+        else:
+            lead_type, priority_columns = 'General', ['Spice Priority', 'Oil Priority']
+        table = _with_constant_column(table, 'Lead Type', lead_type, categorical=True)
+
+        # Standardize Priority column
+        names = table.column_names
+        source = next((c for c in priority_columns if c in names), None)
+        if source is not None:
+            table = table.rename_columns(['Priority' if n == source else n for n in names])
+        elif lead_type == 'General' and 'Priority' not in names:
+            table = _with_constant_column(table, 'Priority', 'LOW')
+
+        index = table.schema.get_field_index('Borough')
+        if index < 0:
+            table = _with_constant_column(table, 'Borough', get_borough_from_path(file), categorical=True)
+        else:
+            table = table.set_column(index, 'Borough', table.column(index).dictionary_encode())
+
+        return table
+    except Exception as e:
+        print(f"Error loading {file}: {e}")
+        return None
+
+
+def _data_signature(files: List[Path]) -> tuple:
+    """Identify the current state of the files by path, mtime and size; missing files are left out."""
+    signature = []
+    for file in files:
+        try:
+            stat = file.stat()
+        except FileNotFoundError:
+            continue
+        signature.append((str(file), stat.st_mtime_ns, stat.st_size))
+    return tuple(sorted(signature))
+
+
+def _list_business_files(data_dir: Path) -> List[Path]:
+    """
+    All business CSVs under data_dir, sorted by path so results don't depend on the order the
+    filesystem lists them. The tree is only walked again when one of its directories changed
+    (an entry added, removed or renamed).
+    """
+    global _business_files_cache
+    directories, files = _business_files_cache
+    try:
+        if directories is not None and all(os.stat(path).st_mtime_ns == mtime for path, mtime in directories):
+            return files
+    except OSError:
+        pass
+
+    # Only a completely walked tree is cached; a missing data directory or a directory that
+    # vanished mid-walk means walking again next time instead of reusing a partial listing
+    _business_files_cache = (None, [])
+    try:
+        directories, files = [(str(data_dir), os.stat(data_dir).st_mtime_ns)], []
+    except OSError:
+        return []
+
+    complete = True
+    def walk_error(error: OSError):
+        nonlocal complete
+        complete = False
+
+    # The caches and the contacts database are rewritten at runtime and hold no business CSVs
+    skipped = {PARQUET_CACHE_DIR.resolve(), CONTACTS_DB.parent.resolve()}
+    for root, subdirectories, names in os.walk(data_dir, onerror=walk_error):
+        subdirectories[:] = [name for name in subdirectories if Path(root, name).resolve() not in skipped]
+        if root != str(data_dir):
+            try:
+                directories.append((root, os.stat(root).st_mtime_ns))
+            except OSError:
+                complete = False
+        files.extend(Path(root, name) for name in names if fnmatch.fnmatch(name, '*_businesses_*.csv'))
+    files.sort()
+    if complete:
+        _business_files_cache = (directories, files)
+    return files
+
+
 def load_and_clean_data() -> List[dict]:
     """
     Loads all business data from CSV files, cleans it, and performs professional deduplication.
     Returns a list of dictionaries, ready to be served as JSON.
+    The result is cached until one of the business files is added, removed or modified;
+    a contact status change only re-applies the contacts to the cached records.
     """
+    global _records_cache
     data_dir = Path(__file__).parent.parent.parent.joinpath('data')
-    data_frames = []
 
-    all_files = list(data_dir.rglob("*_businesses_*.csv"))
-    if not all_files:
+    with _records_lock:
+        all_files = _list_business_files(data_dir)
+        signature = _data_signature(all_files)
+        # Committed updates land in the write-ahead log first, so it is part of the signature
+        # (another connection closing can delete the -wal file at any moment)
+        contacts_signature = _data_signature([CONTACTS_DB, CONTACTS_DB.with_name(CONTACTS_DB.name + '-wal')])
+        cached_signature, cached_contacts_signature, base_records, records = _records_cache
+        if cached_signature == signature and cached_contacts_signature == contacts_signature:
+            return records
+
+        if cached_signature != signature:
+            base_records = _load_records(all_files, data_dir, signature) if all_files else []
+        records = _apply_contacts(base_records)
+        _records_cache = (signature, contacts_signature, base_records, records)
+        return records
+
+
+def _connect_contacts() -> sqlite3.Connection:
+    """Open the contacts database in autocommit mode, creating it on first use."""
+    CONTACTS_DB.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(CONTACTS_DB, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    conn.execute(
+        'CREATE TABLE IF NOT EXISTS contacts ('
+        'business_name TEXT PRIMARY KEY, contacted INTEGER NOT NULL, contact_date TEXT, contact_notes TEXT)'
+    )
+    return conn
+
+
+def _read_contacts() -> Dict[str, tuple]:
+    """(contacted, contact_date, contact_notes) per business name."""
+    if not CONTACTS_DB.exists():
+        return {}
+    with closing(_connect_contacts()) as conn:
+        rows = conn.execute('SELECT business_name, contacted, contact_date, contact_notes FROM contacts')
+        return {name: (bool(contacted), date, notes) for name, contacted, date, notes in rows}
+
+
+def _apply_contacts(records: List[dict]) -> List[dict]:
+    """Overlay the stored contact statuses on the records, leaving the cached records untouched."""
+    contacts = _read_contacts()
+    if not contacts:
+        return records
+
+    updated = []
+    for record in records:
+        contact = contacts.get(record['Business Name'])
+        if contact is not None:
+            contacted, date, notes = contact
+            record = {**record, 'Contacted': contacted, 'Contact_Date': date, 'Contact_Notes': notes}
+        updated.append(record)
+    return updated
+
+
+def _normalize_names(names: pa.ChunkedArray) -> np.ndarray:
+    """
+    Duplicate-matching key for each business name: lowercase, drop common business
+    suffixes, keep only letters and digits. Runs as Arrow kernels rather than per-row Python.
+    Returned as integer codes (equal names share a code), so grouping hashes ints, not strings.
+    """
+    # Missing names match each other as 'none', as astype(str) made them before
+    names = pc.utf8_trim_whitespace(pc.utf8_lower(names.fill_null('None')))
+    for suffix in NAME_SUFFIXES:
+        names = pc.utf8_trim_whitespace(pc.replace_substring_regex(names, re.escape(suffix) + '$', ''))
+    keys = pc.replace_substring_regex(names, '[^a-z0-9]+', '').combine_chunks()
+    return pc.dictionary_encode(keys).indices.to_numpy()
+
+
+def _load_records(all_files: List[Path], data_dir: Path, signature: tuple) -> List[dict]:
+    """
+    Deduplicated records for the given business files. The result is also kept as
+    Parquet, keyed by the files' signature and the cache format, so a restart with
+    unchanged data and code skips combining and deduplicating altogether.
+    """
+    cache_dir = PARQUET_CACHE_DIR / CACHE_KEY
+    cached = cache_dir / f"records_{hashlib.sha1(repr(signature).encode()).hexdigest()}.parquet"
+    try:
+        return _table_to_records(pq.read_table(cached))
+    except (OSError, pa.ArrowInvalid):
+        pass
+
+    table = _build_table(all_files, data_dir)
+    if table is None:
         return []
 
-    def get_borough_from_path(file_path: Path) -> str:
-        """Extract borough name from file path dynamically."""
-        borough_folder = file_path.parent.name
-        
-        
-        borough_name = borough_folder.replace('_', ' ').title()
-        
-        # Handle special cases for better display
-        if 'hammersmith' in borough_folder.lower():
-            return 'Hammersmith & Fulham'
-        elif 'richmond' in borough_folder.lower():
-            return 'Richmond upon Thames'
-        elif 'kingston' in borough_folder.lower():
-            return 'Kingston upon Thames'
-        
-        return borough_name
-
-    for file in all_files:
-        try:
-            df = pd.read_csv(file)
-            
-            # Standardize Priority column
-            if 'spice' in file.stem.lower():
-                df['Lead Type'] = 'Spice'
-                df.rename(columns={'Spice Priority': 'Priority'}, inplace=True)
-            elif 'oil' in file.stem.lower():
-                df['Lead Type'] = 'Cooking Oil'
-                df.rename(columns={'Oil Priority': 'Priority'}, inplace=True)
+    # Drop the previous result and anything written under another cache format
+    for stale in cache_dir.glob('records_*.parquet'):
+        stale.unlink(missing_ok=True)
+    if PARQUET_CACHE_DIR.is_dir():
+        for stale in PARQUET_CACHE_DIR.iterdir():
+            if stale.name == CACHE_KEY:
+                continue
+            if stale.is_dir():
+                shutil.rmtree(stale, ignore_errors=True)
             else:
-                df['Lead Type'] = 'General'
-                if 'Spice Priority' in df.columns: df.rename(columns={'Spice Priority': 'Priority'}, inplace=True)
-                elif 'Oil Priority' in df.columns: df.rename(columns={'Oil Priority': 'Priority'}, inplace=True)
-                elif 'Priority' not in df.columns: df['Priority'] = 'LOW'
-
-            
-            if 'Borough' not in df.columns:
-                df['Borough'] = get_borough_from_path(file)
-            
-            data_frames.append(df)
-        except Exception:
-            continue
+                stale.unlink(missing_ok=True)
+    _write_parquet_cache(table, cached)
+    return _table_to_records(table)
 
-    if not data_frames:
-        return []
 
-    combined_df = pd.concat(data_frames, ignore_index=True)
+def _table_to_records(table: pa.Table) -> List[dict]:
+    """
+    Row dicts for the table. Categorical columns get one shared str per distinct value
+    instead of a separate copy in every record.
+    """
+    records = table.to_pylist()
+    for field in table.schema:
+        if pa.types.is_dictionary(field.type):
+            shared = {}
+            for record in records:
+                value = record[field.name]
+                record[field.name] = shared.setdefault(value, value)
+    return records
 
-    # --- Improved Deduplication ---
-    def normalize_business_name(text):
-        # remove common business suffix
-        text = str(text).lower().strip()
-        # Remove common endings
-        for suffix in [' ltd', ' limited', ' restaurant', ' cafe', ' takeaway', ' kitchen', ' grill']:
-            if text.endswith(suffix):
-                text = text[:-len(suffix)].strip()
-        #remove all non 
-        text = re.sub(r'[^a-z0-9\s]', '', text)
-        # Remove extra spaces
-        text = re.sub(r'\s+', '', text)
-        return text
-
-    def extract_street_name(address):
-        if pd.isna(address):
-            return ''
-        address = str(address).lower()
-        # Take first part before first comma and normalize
-        street_part = address.split(',')[0].strip()
-        # Remove numbers and normalize to just street name
-        street_part = re.sub(r'\d+[a-z]*\s*', '', street_part)  # Remove numbers
-        street_part = re.sub(r'[^a-z\s]', '', street_part)  # Keep only letters and spaces
-        street_part = re.sub(r'\s+', '', street_part)  # Remove spaces
-        return street_part
-
-    # Create better deduplication keys
-    combined_df['normalized_name'] = combined_df['Business Name'].apply(normalize_business_name)
-    combined_df['street_key'] = combined_df['Address'].apply(extract_street_name)
-    combined_df['dedupe_key'] = combined_df['normalized_name'] + '_' + combined_df['street_key']
 
-    #add scoring to keep the best record for each duplicate
-    combined_df['info_score'] = (
-        combined_df['Phone'].notna().astype(int) + 
-        combined_df['Website'].notna().astype(int) + 
-        combined_df['Email'].notna().astype(int) + 
-        (combined_df['Priority'] == 'HIGH').astype(int) * 2 +
-        (combined_df['Priority'] == 'MEDIUM').astype(int)
+def _build_table(all_files: List[Path], data_dir: Path) -> Optional[pa.Table]:
+    """Read, combine and deduplicate the business files."""
+    convert_options = pacsv.ConvertOptions(column_types=CSV_COLUMN_TYPES, strings_can_be_null=True)
+
+    # pyarrow releases the GIL while reading and parsing, so files are loaded in parallel
+    with ThreadPoolExecutor(max_workers=min(CSV_READ_WORKERS, len(all_files))) as executor:
+        tables = executor.map(lambda file: _load_business_file(file, data_dir, convert_options), all_files)
+        tables = [table for table in tables if table is not None]
+
+    if not tables:
+        return None
+
+    combined_table = pa.concat_tables(tables, promote_options='default')
+    name_codes = _normalize_names(combined_table.column('Business Name'))
+    # Position of each Business Name in sorted order (missing names last), for tie-breaking
+    name_ranks = pc.rank(
+        combined_table.column('Business Name').combine_chunks(), sort_keys='ascending', tiebreaker='dense'
+    ).to_numpy().astype(np.int64)
+    combined_df = combined_table.to_pandas()
+
+    # Low-cardinality columns as categoricals (Lead Type and Borough already are)
+    # Tiers are matched case-insensitively; any other value is kept, ranked after the known tiers
+    priority = combined_df['Priority'].str.strip().str.upper()
+    unknown = sorted(set(priority.dropna().unique()) - set(PRIORITY_DTYPE.categories))
+    combined_df['Priority'] = priority.astype(
+        pd.CategoricalDtype([*PRIORITY_DTYPE.categories, *unknown], ordered=True) if unknown else PRIORITY_DTYPE
     )
+    combined_df['Cuisine Type'] = combined_df['Cuisine Type'].astype('category')
 
-    # Sort by score (best first) and deduplicate
-    combined_df.sort_values(['info_score', 'Business Name'], ascending=[False, True], inplace=True)
+    # --- Improved Deduplication ---
+    #add scoring to keep the best record for each duplicate
+    priority = combined_df['Priority'].to_numpy()
+    info_score = (
+        combined_df['Phone'].notna().to_numpy(np.int8)
+        + combined_df['Website'].notna().to_numpy(np.int8)
+        + combined_df['Email'].notna().to_numpy(np.int8)
+        + (priority == 'HIGH') * np.int8(2)
+        + (priority == 'MEDIUM')
+    )
+    # Highest info score wins; among equal scores the lowest Business Name, then the first read
+    selection_key = info_score.astype(np.int64) * (len(name_ranks) + 1) - name_ranks
+    selection_key = pd.Series(selection_key, index=combined_df.index)
 
-    combined_df_deduped = combined_df.drop_duplicates(subset=['dedupe_key'], keep='first')
-    
-    combined_df_deduped = combined_df_deduped.drop_duplicates(subset=['normalized_name'], keep='first')
+    # Keep the best record per normalized name.
+    # Name+street duplicates are a subset of name duplicates, so one pass covers both.
+    # The key and score stay outside the frame, so no helper columns are added and dropped.
+    best = selection_key.groupby(name_codes, sort=False).idxmax()
+    combined_df_deduped = combined_df.loc[best].reset_index(drop=True)
     
     # Add contact tracking columns if they don't exist
     if 'Contacted' not in combined_df_deduped.columns:
@@ -118,58 +419,29 @@ def load_and_clean_data() -> List[dict]:
     if 'Contact_Notes' not in combined_df_deduped.columns:
         combined_df_deduped['Contact_Notes'] = ''
     
-    # Clean up and prepare for JSON
-    combined_df_deduped = combined_df_deduped.drop(columns=['normalized_name', 'street_key', 'dedupe_key', 'info_score'])
-    combined_df_deduped['Postcode'] = combined_df_deduped['Postcode'].str.split().str[0]
+    # Postcode district: the first whitespace-separated token
+    combined_df_deduped['Postcode'] = combined_df_deduped['Postcode'].str.extract(r'(\S+)', expand=False).astype('category')
     
-    # Convert NaN to None for proper JSON representation
-    combined_df_deduped = combined_df_deduped.where(pd.notnull(combined_df_deduped), None)
-
-    return combined_df_deduped.to_dict('records')
+    # As Arrow, NaN and missing categories become None in the records for proper JSON
+    # representation, without first copying the whole frame to object dtype
+    return pa.Table.from_pandas(combined_df_deduped, preserve_index=False)
 
 
 def update_contact_status(business_name: str, contacted: bool, contact_notes: Optional[str] = None) -> bool:
     """
-    Updates the contact status for a specific business in CSV files.
+    Stores the contact status for a specific business in the contacts database.
     Returns True if successful, False if business not found.
     """
-    data_dir = Path(__file__).parent.parent.parent.joinpath('data')
-    all_files = list(data_dir.rglob("*_businesses_*.csv"))
-    
-    if not all_files:
+    if not any(record['Business Name'] == business_name for record in load_and_clean_data()):
         return False
-    
-    business_updated = False
+
     contact_date = datetime.now().strftime('%Y-%m-%d') if contacted else None
-    
-    for file in all_files:
-        try:
-            df = pd.read_csv(file)
-            
-            # Find the business by name
-            business_mask = df['Business Name'] == business_name
-            if business_mask.any():
-                # Add contact columns if they don't exist - fill with defaults
-                if 'Contacted' not in df.columns:
-                    df['Contacted'] = False
-                if 'Contact_Date' not in df.columns:
-                    df['Contact_Date'] = ''
-                if 'Contact_Notes' not in df.columns:
-                    df['Contact_Notes'] = ''
-                
-                # Update the contact information for the specific business
-                df.loc[business_mask, 'Contacted'] = contacted
-                df.loc[business_mask, 'Contact_Date'] = contact_date if contact_date else ''
-                df.loc[business_mask, 'Contact_Notes'] = contact_notes if contact_notes else ''
-                
-                # Save back to CSV with new columns
-                df.to_csv(file, index=False)
-                business_updated = True
-                print(f"Updated {business_name} in {file.name}")
-                # Don't break - continue to update ALL files that contain this business
-                
-        except Exception as e:
-            print(f"Error updating {file}: {e}")
-            continue
-    
-    return business_updated 
\ No newline at end of file
+    # One upserted row per business instead of rewriting every CSV that lists it
+    with closing(_connect_contacts()) as conn:
+        conn.execute(
+            'INSERT OR REPLACE INTO contacts (business_name, contacted, contact_date, contact_notes) VALUES (?, ?, ?, ?)',
+            (business_name, int(contacted), contact_date, contact_notes or None)
+        )
+
+    print(f"Updated {business_name} in {CONTACTS_DB.name}")
+    return True
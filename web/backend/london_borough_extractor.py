@@ -3,12 +3,14 @@
 import requests
 import pandas as pd
 import json
+import gzip
+import hashlib
+import asyncio
 import time
 import logging
 import os
 import argparse
-from typing import Dict, List, Optional
-from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
 from geopy.geocoders import Nominatim
 from dotenv import load_dotenv
 import re
@@ -17,136 +19,183 @@ from pathlib import Path
 # Load environment variables
 load_dotenv()
 
-@dataclass
-class BusinessData:
-    name: str
-    address: str
-    phone: Optional[str] = None
-    website: Optional[str] = None
-    email: Optional[str] = None
-    cuisine_type: Optional[str] = None
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
-    postcode: Optional[str] = None
-    source: str = "unknown"
-    priority: str = "low"  # high, medium, low
-    lead_type: str = "general"  # cooking_oil, spice, general
+logger = logging.getLogger(__name__)
+
+def setup_logging(borough_name: str) -> logging.Logger:
+    """Attach console and per-borough file handlers to the module logger.
+
+    The console handler is only added once; the file handler is swapped on each
+    call so batch runs don't leak a handler per borough.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    if not logger.handlers:
+        logger.setLevel(logging.INFO)
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        logger.addHandler(stream_handler)
+
+    for handler in [h for h in logger.handlers if isinstance(h, logging.FileHandler)]:
+        logger.removeHandler(handler)
+        handler.close()
+
+    data_path = Path(__file__).parent.parent.parent / 'data' / borough_name.lower()
+    file_handler = logging.FileHandler(data_path / f'{borough_name.lower()}_extraction.log')
+    file_handler.setFormatter(formatter)
+    logger.addHandler(file_handler)
+    return logger
+
+# Major London postcodes by borough
+_BOROUGH_POSTCODES = {
+    'westminster': ['W1', 'SW1', 'W2', 'WC1', 'WC2'],
+    'camden': ['NW1', 'NW3', 'WC1', 'N1', 'N7'],
+    'islington': ['N1', 'N4', 'N5', 'N7', 'N19'],
+    'tower_hamlets': ['E1', 'E2', 'E3', 'E14', 'E1W'],
+    'southwark': ['SE1', 'SE5', 'SE15', 'SE16', 'SE17'],
+    'lambeth': ['SE1', 'SE11', 'SE24', 'SE27', 'SW2', 'SW4', 'SW8', 'SW9'],
+    'wandsworth': ['SW8', 'SW11', 'SW12', 'SW15', 'SW17', 'SW18', 'SW19'],
+    'hammersmith_fulham': ['W6', 'W12', 'W14', 'SW6', 'SW10'],
+    'barnet': ['EN4', 'EN5', 'N2', 'N3', 'N11', 'N12', 'N14', 'N20', 'NW4', 'NW7'],
+    'enfield': ['EN1', 'EN2', 'EN3', 'N9', 'N13', 'N14', 'N18', 'N21'],
+    'waltham_forest': ['E4', 'E10', 'E11', 'E17', 'N15'],
+    'newham': ['E6', 'E7', 'E12', 'E13', 'E15', 'E16'],
+    'greenwich': ['SE3', 'SE7', 'SE8', 'SE9', 'SE10', 'SE18'],
+    'lewisham': ['SE4', 'SE6', 'SE12', 'SE13', 'SE14', 'SE23', 'BR1'],
+    'bromley': ['BR1', 'BR2', 'BR3', 'BR4', 'BR5', 'BR6', 'BR7', 'SE9', 'SE19', 'SE20'],
+    'croydon': ['CR0', 'CR2', 'CR4', 'CR7', 'CR8', 'SE19', 'SE25', 'SW16'],
+    'brent': ['NW2', 'NW6', 'NW9', 'NW10', 'HA0', 'HA9'],
+    'ealing': ['W3', 'W5', 'W7', 'W13', 'UB1', 'UB2', 'UB6'],
+    'hounslow': ['TW3', 'TW4', 'TW5', 'TW13', 'TW14', 'UB3', 'UB4'],
+    'richmond': ['TW1', 'TW2', 'TW9', 'TW10', 'SW13', 'SW14', 'SW15', 'KT2'],
+    'kingston': ['KT1', 'KT2', 'KT3', 'KT4', 'KT5', 'KT6', 'SW15', 'SW20']
+}
+
+# Expand to include district codes (e.g., W1 0, W1 1...)
+_EXPANDED = {
+    borough: tuple(f"{base} {i}" for base in bases for i in range(10))
+    for borough, bases in _BOROUGH_POSTCODES.items()
+}
+
+# Worker pool sizes for the geocode -> Overpass -> parse pipeline. Nominatim's
+# usage policy allows one request per second, so geocoding stays single-file.
+GEOCODE_WORKERS = 1
+OVERPASS_WORKERS = 2
+PARSE_WORKERS = 1
+PIPELINE_QUEUE_SIZE = 64
+
+OVERPASS_CACHE_DIR = Path(__file__).parent.parent.parent / 'data' / '.overpass_cache'
+
+# Output columns in CSV order; results are accumulated column-wise as lists
+COLUMNS = (
+    'Priority', 'Lead Type', 'Business Name', 'Cuisine Type', 'Address', 'Postcode',
+    'Phone', 'Website', 'Latitude', 'Longitude', 'Source'
+)
+
+# Sort ranks for the saved CSV (cooking oil first, then priority)
+_SORT_RANKS = {
+    'Lead Type': {'Cooking Oil': 0, 'Spice': 1, 'General': 2},
+    'Priority': {'HIGH': 0, 'MEDIUM': 1, 'LOW': 2},
+}
+
+def new_columns() -> Dict[str, list]:
+    """Return an empty column-wise result set."""
+    return {column: [] for column in COLUMNS}
 
 class LondonBoroughExtractor:
-    def __init__(self, borough_name: str):
+    def __init__(self, borough_name: str, use_cache: bool = True):
         self.borough_name = borough_name
+        self.use_cache = use_cache
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         self.geolocator = Nominatim(user_agent=f"london_{borough_name.lower()}_extractor_2025")
+        self._coordinates: Dict[str, Optional[tuple]] = {}
         
         # Setup logging - go up two directories to reach data folder
         data_path = Path(__file__).parent.parent.parent / 'data' / borough_name.lower()
         data_path.mkdir(parents=True, exist_ok=True)
-        
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(data_path / f'{borough_name.lower()}_extraction.log'),
-                logging.StreamHandler()
-            ]
-        )
-        self.logger = logging.getLogger(__name__)
+        self.logger = setup_logging(borough_name)
         
     def get_borough_postcodes(self) -> List[str]:
         """Get postcode districts for the borough."""
-        # Major London postcodes by borough
-        borough_postcodes = {
-            'westminster': ['W1', 'SW1', 'W2', 'WC1', 'WC2'],
-            'camden': ['NW1', 'NW3', 'WC1', 'N1', 'N7'],
-            'islington': ['N1', 'N4', 'N5', 'N7', 'N19'],
-            'tower_hamlets': ['E1', 'E2', 'E3', 'E14', 'E1W'],
-            'southwark': ['SE1', 'SE5', 'SE15', 'SE16', 'SE17'],
-            'lambeth': ['SE1', 'SE11', 'SE24', 'SE27', 'SW2', 'SW4', 'SW8', 'SW9'],
-            'wandsworth': ['SW8', 'SW11', 'SW12', 'SW15', 'SW17', 'SW18', 'SW19'],
-            'hammersmith_fulham': ['W6', 'W12', 'W14', 'SW6', 'SW10'],
-            'barnet': ['EN4', 'EN5', 'N2', 'N3', 'N11', 'N12', 'N14', 'N20', 'NW4', 'NW7'],
-            'enfield': ['EN1', 'EN2', 'EN3', 'N9', 'N13', 'N14', 'N18', 'N21'],
-            'waltham_forest': ['E4', 'E10', 'E11', 'E17', 'N15'],
-            'newham': ['E6', 'E7', 'E12', 'E13', 'E15', 'E16'],
-            'greenwich': ['SE3', 'SE7', 'SE8', 'SE9', 'SE10', 'SE18'],
-            'lewisham': ['SE4', 'SE6', 'SE12', 'SE13', 'SE14', 'SE23', 'BR1'],
-            'bromley': ['BR1', 'BR2', 'BR3', 'BR4', 'BR5', 'BR6', 'BR7', 'SE9', 'SE19', 'SE20'],
-            'croydon': ['CR0', 'CR2', 'CR4', 'CR7', 'CR8', 'SE19', 'SE25', 'SW16'],
-            'brent': ['NW2', 'NW6', 'NW9', 'NW10', 'HA0', 'HA9'],
-            'ealing': ['W3', 'W5', 'W7', 'W13', 'UB1', 'UB2', 'UB6'],
-            'hounslow': ['TW3', 'TW4', 'TW5', 'TW13', 'TW14', 'UB3', 'UB4'],
-            'richmond': ['TW1', 'TW2', 'TW9', 'TW10', 'SW13', 'SW14', 'SW15', 'KT2'],
-            'kingston': ['KT1', 'KT2', 'KT3', 'KT4', 'KT5', 'KT6', 'SW15', 'SW20']
-        }
-        
-        base_postcodes = borough_postcodes.get(self.borough_name.lower(), [])
+        base_postcodes = _BOROUGH_POSTCODES.get(self.borough_name.lower(), [])
         if not base_postcodes:
-            self.logger.error(f"No postcodes defined for {self.borough_name}")
+            self.logger.error("No postcodes defined for %s", self.borough_name)
             return []
             
-        # Expand to include district codes (e.g., W1 0, W1 1...)
-        expanded_postcodes = []
-        for base in base_postcodes:
-            for i in range(10):
-                expanded_postcodes.append(f"{base} {i}")
-        
-        self.logger.info(f"Targeting {len(expanded_postcodes)} postcode areas across {len(base_postcodes)} districts in {self.borough_name}")
+        expanded_postcodes = list(_EXPANDED[self.borough_name.lower()])
+        self.logger.info("Targeting %d postcode areas across %d districts in %s", len(expanded_postcodes), len(base_postcodes), self.borough_name)
         return expanded_postcodes
     
-    def extract_overpass_businesses(self, postcode: str) -> List[BusinessData]:
-        """Extract businesses using OpenStreetMap, prioritizing oil customers with spice businesses."""
-        businesses = []
-        try:
-            location = self.geolocator.geocode(f"{postcode}, {self.borough_name}, London, UK")
-            if not location:
-                base_postcode = postcode.split()[0]
-                location = self.geolocator.geocode(f"{base_postcode}, {self.borough_name}, London, UK")
-            
-            if not location:
-                self.logger.warning(f"Could not geocode {postcode}")
-                return []
-            
-            lat, lng = location.latitude, location.longitude
-            self.logger.info(f"Geocoded {postcode} to {lat:.4f}, {lng:.4f}")
-            
-            # Overpass query focused on cooking oil + spice businesses
-            overpass_query = f"""
-            [out:json][timeout:45];
-            (
-              // HIGH PRIORITY: Oil-heavy businesses (fish & chips, fried food, fast food)
-              nwr["amenity"~"^(fast_food|restaurant|cafe)$"](around:800,{lat},{lng});
-              nwr["cuisine"~"fish_and_chips|kebab|chicken|burger|pizza|fried|takeaway|american"](around:800,{lat},{lng});
-              
-              // SPICE BUSINESSES: Indian, Chinese, Thai, etc.
-              nwr["cuisine"~"indian|chinese|thai|asian|curry|bengali|pakistani|turkish|mediterranean"](around:800,{lat},{lng});
-              
-              // Wholesalers and suppliers
-              nwr["shop"~"wholesale|cash_and_carry|convenience|supermarket"](around:800,{lat},{lng});
-            );
-            out center meta;
-            """
-            
-            response = self.session.post("http://overpass-api.de/api/interpreter", data=overpass_query, timeout=60)
-            
-            if response.status_code == 200:
-                data = response.json()
-                businesses = self._parse_overpass_data(data, postcode)
-                self.logger.info(f"OpenStreetMap: Found {len(businesses)} businesses near {postcode}")
-            else:
-                self.logger.warning(f"Overpass API failed for {postcode}: {response.status_code}")
-                
-        except Exception as e:
-            self.logger.error(f"Overpass API error for {postcode}: {str(e)}")
-            
-        time.sleep(1)  # Rate limiting
-        return businesses
+    def _geocode(self, query: str) -> Optional[tuple]:
+        """Geocode a postcode within the borough, memoising hits and misses."""
+        if query not in self._coordinates:
+            location = self.geolocator.geocode(f"{query}, {self.borough_name}, London, UK")
+            self._coordinates[query] = (location.latitude, location.longitude) if location else None
+            time.sleep(1)  # Nominatim rate limiting
+        return self._coordinates[query]
+
+    def _geocode_postcode(self, postcode: str) -> Optional[tuple]:
+        """Geocode a postcode sector, falling back to its district."""
+        # Sectors that don't resolve share their district's coordinates, so the
+        # fallback lookup only hits Nominatim once per district
+        coords = self._geocode(postcode) or self._geocode(postcode.split()[0])
+        if not coords:
+            self.logger.warning("Could not geocode %s", postcode)
+            return None
+        
+        lat, lng = coords
+        self.logger.info("Geocoded %s to %.4f, %.4f", postcode, lat, lng)
+        return lat, lng
 
-    def _parse_overpass_data(self, data: Dict, postcode: str) -> List[BusinessData]:
-        """Parse OpenStreetMap data with cooking oil priority and spice classification."""
-        businesses = []
+    def _fetch_overpass(self, postcode: str, lat: float, lng: float) -> Optional[Tuple[bytes, Optional[Path]]]:
+        """Run the Overpass query around a point and return the raw JSON body.
+
+        The body comes with the cache path to store it under, or None when it was read from the cache.
+        """
+        # Overpass query focused on cooking oil + spice businesses
+        overpass_query = f"""
+        [out:json][timeout:45];
+        (
+          // HIGH PRIORITY: Oil-heavy businesses (fish & chips, fried food, fast food)
+          nwr["amenity"~"^(fast_food|restaurant|cafe)$"](around:800,{lat},{lng});
+          nwr["cuisine"~"fish_and_chips|kebab|chicken|burger|pizza|fried|takeaway|american"](around:800,{lat},{lng});
+          
+          // SPICE BUSINESSES: Indian, Chinese, Thai, etc.
+          nwr["cuisine"~"indian|chinese|thai|asian|curry|bengali|pakistani|turkish|mediterranean"](around:800,{lat},{lng});
+          
+          // Wholesalers and suppliers
+          nwr["shop"~"wholesale|cash_and_carry|convenience|supermarket"](around:800,{lat},{lng});
+        );
+        out center meta;
+        """
+        
+        # Responses are cached by query so reruns skip the HTTP round-trip
+        digest = hashlib.blake2b(overpass_query.encode('utf-8'), digest_size=16).hexdigest()
+        cache_path = OVERPASS_CACHE_DIR / f"{digest}.json.gz"
+        if self.use_cache and cache_path.exists():
+            self.logger.info("Using cached Overpass response for %s", postcode)
+            return gzip.decompress(cache_path.read_bytes()), None
+        
+        response = self.session.post("http://overpass-api.de/api/interpreter", data=overpass_query, timeout=60)
+        if response.status_code != 200:
+            self.logger.warning("Overpass API failed for %s: %s", postcode, response.status_code)
+            return None
+        return response.content, cache_path
+
+    def _cache_overpass(self, content: bytes, cache_path: Path):
+        """Store a parsed Overpass body so reruns can skip the query."""
+        OVERPASS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix('.tmp')
+        tmp_path.write_bytes(gzip.compress(content))
+        tmp_path.replace(cache_path)
+
+    def _parse_overpass_data(self, data: Dict, postcode: str, columns: Dict[str, list]) -> int:
+        """Parse OpenStreetMap data with cooking oil priority and spice classification.
+
+        Rows are appended to ``columns`` in place; returns the number added.
+        """
+        found = 0
         for element in data.get('elements', []):
             tags = element.get('tags', {})
             name = tags.get('name', '').strip()
@@ -168,20 +217,19 @@ class LondonBoroughExtractor:
 
             priority, lead_type = self._calculate_priority_and_type(name, cuisine, amenity, shop)
             
-            businesses.append(BusinessData(
-                name=name,
-                address=address,
-                phone=tags.get('phone'),
-                website=tags.get('website'),
-                cuisine_type=cuisine or amenity or shop,
-                latitude=lat,
-                longitude=lng,
-                postcode=postcode,
-                source="OpenStreetMap",
-                priority=priority,
-                lead_type=lead_type
-            ))
-        return businesses
+            columns['Priority'].append(priority.upper())
+            columns['Lead Type'].append(lead_type.title().replace('_', ' '))
+            columns['Business Name'].append(name)
+            columns['Cuisine Type'].append(cuisine or amenity or shop)
+            columns['Address'].append(address)
+            columns['Postcode'].append(postcode)
+            columns['Phone'].append(tags.get('phone'))
+            columns['Website'].append(tags.get('website'))
+            columns['Latitude'].append(lat)
+            columns['Longitude'].append(lng)
+            columns['Source'].append("OpenStreetMap")
+            found += 1
+        return found
 
     def _calculate_priority_and_type(self, name: str, cuisine: str, amenity: str, shop: str) -> tuple:
         """Calculate priority and lead type (cooking oil priority)."""
@@ -217,71 +265,151 @@ class LondonBoroughExtractor:
         else:
             return "low", "general"
 
-    def save_results(self, businesses: List[BusinessData]) -> str:
+    def save_results(self, columns: Dict[str, list]) -> str:
         """Save results with cooking oil priority organization."""
         timestamp = time.strftime("%Y%m%d_%H%M%S")
         
-        # Sort by lead type (oil first), then priority, then name
-        businesses.sort(key=lambda x: (
-            {"cooking_oil": 0, "spice": 1, "general": 2}[x.lead_type],
-            {"high": 0, "medium": 1, "low": 2}[x.priority], 
-            x.name
-        ))
-        
-        df_data = [{
-            'Priority': b.priority.upper(),
-            'Lead Type': b.lead_type.title().replace('_', ' '),
-            'Business Name': b.name,
-            'Cuisine Type': b.cuisine_type,
-            'Address': b.address,
-            'Postcode': b.postcode,
-            'Phone': b.phone,
-            'Website': b.website,
-            'Latitude': b.latitude,
-            'Longitude': b.longitude,
-            'Source': b.source,
-            'Contacted': False,
-            'Contact_Date': '',
-            'Contact_Notes': ''
-        } for b in businesses]
+        df = pd.DataFrame(columns)
         
-        df = pd.DataFrame(df_data)
+        # Sort by lead type (oil first), then priority, then name
+        df.sort_values(
+            ['Lead Type', 'Priority', 'Business Name'],
+            key=lambda col: col.map(_SORT_RANKS[col.name]) if col.name in _SORT_RANKS else col,
+            inplace=True
+        )
+        df['Contacted'] = False
+        df['Contact_Date'] = ''
+        df['Contact_Notes'] = ''
         
         # Save to data/{borough} directory (up from backend)
         data_path = Path(__file__).parent.parent.parent / 'data' / self.borough_name.lower()
         filename = data_path / f"{self.borough_name.lower()}_businesses_{timestamp}.csv"
         df.to_csv(filename, index=False)
-        self.logger.info(f"💾 Saved {len(df)} businesses to {filename}")
+        self.logger.info("💾 Saved %d businesses to %s", len(df), filename)
         
         # Log statistics
         priority_counts = df['Priority'].value_counts()
         lead_type_counts = df['Lead Type'].value_counts()
         
-        self.logger.info(f"📊 Priority breakdown - High: {priority_counts.get('HIGH', 0)}, Medium: {priority_counts.get('MEDIUM', 0)}, Low: {priority_counts.get('LOW', 0)}")
-        self.logger.info(f"🎯 Lead types - Cooking Oil: {lead_type_counts.get('Cooking Oil', 0)}, Spice: {lead_type_counts.get('Spice', 0)}, General: {lead_type_counts.get('General', 0)}")
+        self.logger.info("📊 Priority breakdown - High: %d, Medium: %d, Low: %d",
+                         priority_counts.get('HIGH', 0), priority_counts.get('MEDIUM', 0), priority_counts.get('LOW', 0))
+        self.logger.info("🎯 Lead types - Cooking Oil: %d, Spice: %d, General: %d",
+                         lead_type_counts.get('Cooking Oil', 0), lead_type_counts.get('Spice', 0), lead_type_counts.get('General', 0))
         
         return str(filename)
 
+    async def _run_pipeline(self, postcodes: List[str]) -> Dict[str, list]:
+        """Overlap geocoding, Overpass fetches and parsing across postcodes.
+
+        Each stage has its own worker pool connected by bounded queues, so one
+        postcode can wait on Nominatim while another waits on Overpass.
+        """
+        pending: asyncio.Queue = asyncio.Queue()
+        geocoded: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        fetched: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+        for postcode in postcodes:
+            pending.put_nowait(postcode)
+        
+        columns = new_columns()
+        started = 0
+        finished = 0
+        
+        async def geocode_worker():
+            nonlocal started
+            while not pending.empty():
+                postcode = pending.get_nowait()
+                started += 1
+                self.logger.info("⏳ Processing %s (%d/%d)", postcode, started, len(postcodes))
+                try:
+                    coords = await asyncio.to_thread(self._geocode_postcode, postcode)
+                except Exception as e:
+                    self.logger.error("Geocoding error for %s: %s", postcode, e)
+                    coords = None
+                if coords:
+                    await geocoded.put((postcode, *coords))
+        
+        async def overpass_worker():
+            while (item := await geocoded.get()) is not None:
+                postcode, lat, lng = item
+                try:
+                    response = await asyncio.to_thread(self._fetch_overpass, postcode, lat, lng)
+                except Exception as e:
+                    self.logger.error("Overpass API error for %s: %s", postcode, e)
+                    response = None
+                if response is not None:
+                    await fetched.put((postcode, *response))
+        
+        async def parse_worker():
+            nonlocal finished
+            while (item := await fetched.get()) is not None:
+                postcode, content, cache_path = item
+                # Parse into fresh columns so a bad response adds no partial rows
+                parsed = new_columns()
+                try:
+                    data = json.loads(content)
+                    found = self._parse_overpass_data(data, postcode, parsed)
+                except Exception as e:
+                    self.logger.error("Invalid Overpass response for %s: %s", postcode, e)
+                    continue
+                # Overpass also answers 200 for timeouts and memory errors, reporting them in a
+                # "remark" with empty or partial elements; those must not be cached for later runs
+                if cache_path is not None:
+                    if data.get('remark'):
+                        self.logger.warning("Not caching Overpass response for %s: %s", postcode, data['remark'])
+                    else:
+                        try:
+                            self._cache_overpass(content, cache_path)
+                        except OSError as e:
+                            self.logger.warning("Could not cache Overpass response for %s: %s", postcode, e)
+                for name, values in parsed.items():
+                    columns[name].extend(values)
+                finished += 1
+                self.logger.info("OpenStreetMap: Found %d businesses near %s", found, postcode)
+                
+                # Progress update every 10 postcodes
+                if finished % 10 == 0:
+                    self.logger.info("📈 Progress: %d/%d postcodes processed, %d businesses found", finished, len(postcodes), len(columns['Business Name']))
+        
+        geocoders = [asyncio.create_task(geocode_worker()) for _ in range(GEOCODE_WORKERS)]
+        fetchers = [asyncio.create_task(overpass_worker()) for _ in range(OVERPASS_WORKERS)]
+        parsers = [asyncio.create_task(parse_worker()) for _ in range(PARSE_WORKERS)]
+        
+        async def drain_stages():
+            # Drain each stage in order, then signal the next one to stop
+            await asyncio.gather(*geocoders)
+            for _ in fetchers:
+                await geocoded.put(None)
+            await asyncio.gather(*fetchers)
+            for _ in parsers:
+                await fetched.put(None)
+            await asyncio.gather(*parsers)
+        
+        # A worker that dies would leave the stages around it blocked on their queues,
+        # so stop everything at the first failure instead of waiting forever
+        tasks = [asyncio.create_task(drain_stages()), *geocoders, *fetchers, *parsers]
+        try:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                task.result()
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        
+        return columns
+
     def run_extraction(self):
         """Main extraction process for the borough."""
-        self.logger.info(f"🚀 Starting {self.borough_name.title()} Business Extraction (Cooking Oil Priority + Spices)")
+        self.logger.info("🚀 Starting %s Business Extraction (Cooking Oil Priority + Spices)", self.borough_name.title())
         postcodes = self.get_borough_postcodes()
-        all_businesses = []
-        
-        for i, postcode in enumerate(postcodes, 1):
-            self.logger.info(f"⏳ Processing {postcode} ({i}/{len(postcodes)})")
-            businesses = self.extract_overpass_businesses(postcode)
-            all_businesses.extend(businesses)
-            
-            # Progress update every 10 postcodes
-            if i % 10 == 0:
-                self.logger.info(f"📈 Progress: {i}/{len(postcodes)} postcodes processed, {len(all_businesses)} businesses found")
+        columns = asyncio.run(self._run_pipeline(postcodes))
+        total = len(columns['Business Name'])
         
-        if all_businesses:
-            filename = self.save_results(all_businesses)
-            self.logger.info(f"✅ {self.borough_name.title()} extraction completed! {len(all_businesses)} businesses saved to {filename}")
+        if total:
+            filename = self.save_results(columns)
+            self.logger.info("✅ %s extraction completed! %d businesses saved to %s", self.borough_name.title(), total, filename)
         else:
-            self.logger.warning(f"❌ No businesses found for {self.borough_name}")
+            self.logger.warning("❌ No businesses found for %s", self.borough_name)
 
 def main():
     # Define borough batches
@@ -298,6 +426,8 @@ def main():
                        help='Batch number to extract (1-5)')
     parser.add_argument('--borough', type=str, 
                        help='Extract single borough instead of batch')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore cached Overpass responses and fetch fresh data')
     
     args = parser.parse_args()
     
@@ -314,7 +444,7 @@ def main():
     
     for borough in boroughs:
         print(f"\n🏙️  Starting extraction for {borough}...")
-        extractor = LondonBoroughExtractor(borough)
+        extractor = LondonBoroughExtractor(borough, use_cache=not args.no_cache)
         extractor.run_extraction()
         print(f"✅ {borough} completed!")
         
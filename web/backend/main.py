@@ -1,9 +1,13 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pydantic import BaseModel
+import gzip
+import hashlib
 import logging
 import os
+import threading
+import orjson
 from dotenv import load_dotenv
 from pathlib import Path
 
@@ -46,43 +50,91 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-business_data_cache: List[Dict[str, Any]] = []
+def build_response_cache(body: bytes) -> Tuple[bytes, bytes, str, str]:
+    """
+    Plain and gzip-compressed JSON body, plus the ETag of each. The two bodies differ byte for byte,
+    so the gzip variant gets its own tag derived from the plain one.
+    """
+    digest = hashlib.md5(body).hexdigest()
+    return body, gzip.compress(body, compresslevel=6), f'"{digest}"', f'"{digest}-gzip"'
+
+# Records and the /api/businesses bodies and ETags built from them, always replaced together:
+# (records, JSON body, gzip body, ETag, gzip ETag)
+business_cache: Tuple[List[Dict[str, Any]], bytes, bytes, str, str] = ([], *build_response_cache(b"[]"))
+business_cache_lock = threading.Lock()
+
+def set_business_cache(records: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], bytes, bytes, str, str]:
+    """
+    Store the records with their pre-serialized JSON body and return what is now cached.
+    The loader returns the same list while the data is unchanged, so it is only re-serialized on change.
+    The response is built before it is published, so the records are never visible without it.
+    """
+    global business_cache
+    with business_cache_lock:
+        if records is not business_cache[0]:
+            response = build_response_cache(orjson.dumps(records, option=orjson.OPT_SERIALIZE_NUMPY))
+            business_cache = (records, *response)
+        return business_cache
 
 @app.on_event("startup")
 def startup_event():
     """
     Load data on startup and cache it.
     This makes subsequent requests much faster.
+    The load runs in the background so the server accepts requests (e.g. health checks) right away;
+    business data requests wait for it on the loader's lock.
     """
+    threading.Thread(target=load_initial_data, name="initial-data-load", daemon=True).start()
+
+def load_initial_data():
+    """Fill the business cache for the first time."""
     logger.info("Application startup: Loading and cleaning data...")
     try:
-        global business_data_cache
-        business_data_cache = load_and_clean_data()
-        if not business_data_cache:
+        records = set_business_cache(load_and_clean_data())[0]
+        if not records:
             logger.warning("No data loaded. The 'data' directory might be empty or CSV files are missing.")
         else:
-            logger.info(f"Successfully loaded and cached {len(business_data_cache)} business records.")
+            logger.info(f"Successfully loaded and cached {len(records)} business records.")
     except Exception as e:
         logger.error(f"Fatal error during data loading: {e}", exc_info=True)
         # In a real-world scenario, you might want the app to fail startup
         # if data is essential. For now, we'll let it start empty.
-        business_data_cache = []
+        set_business_cache([])
 
 @app.get("/api/businesses",
          response_model=List[Dict[str, Any]],
          summary="Get All Business Leads",
          description="Returns a list of all business leads after cleaning and deduplication.",
          tags=["Businesses"])
-def get_businesses():
+def get_businesses(request: Request):
     """
     Main endpoint to retrieve all processed business data.
+    Clients revalidating with the current ETag get an empty 304 instead of the full body.
     """
-    if not business_data_cache:
+    cache = business_cache
+    try:
+        # Only re-reads the CSVs when one of them was added, removed or modified
+        cache = set_business_cache(load_and_clean_data())
+    except Exception as e:
+        logger.error(f"Error refreshing data, serving cached copy: {e}", exc_info=True)
+
+    records, body, gzip_body, etag, gzip_etag = cache
+    if not records:
         raise HTTPException(
             status_code=404, 
             detail="No business data available. The server may have failed to load the data source."
         )
-    return business_data_cache
+
+    headers = {"Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if "gzip" in request.headers.get("accept-encoding", ""):
+        body, etag = gzip_body, gzip_etag
+        headers["Content-Encoding"] = "gzip"
+    headers["ETag"] = etag
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        headers.pop("Content-Encoding", None)
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @app.get("/api/reload",
          summary="Reload Business Data",
@@ -93,12 +145,11 @@ def reload_data():
     Reload data from files - useful when new data has been extracted.
     """
     try:
-        global business_data_cache
-        business_data_cache = load_and_clean_data()
+        records = set_business_cache(load_and_clean_data())[0]
         return {
             "status": "success",
-            "message": f"Reloaded {len(business_data_cache)} business records",
-            "count": len(business_data_cache)
+            "message": f"Reloaded {len(records)} business records",
+            "count": len(records)
         }
     except Exception as e:
         logger.error(f"Error reloading data: {e}", exc_info=True)
@@ -112,8 +163,8 @@ def health_check():
     return {
         "status": "ok",
         "environment": os.getenv('ENVIRONMENT', 'development'),
-        "data_loaded": len(business_data_cache) > 0,
-        "business_count": len(business_data_cache),
+        "data_loaded": len(business_cache[0]) > 0,
+        "business_count": len(business_cache[0]),
         "allowed_origins": allowed_origins
     }
 
@@ -136,9 +187,8 @@ def update_business_contact(business_name: str, contact_update: ContactUpdate):
             raise HTTPException(status_code=404, detail="Business not found")
         
         # Reload cache after update
-        global business_data_cache
-        business_data_cache = load_and_clean_data()
-        logger.info(f"Cache reloaded: {len(business_data_cache)} businesses")
+        records = set_business_cache(load_and_clean_data())[0]
+        logger.info(f"Cache reloaded: {len(records)} businesses")
         
         return {
             "status": "success",
@@ -1,24 +1,95 @@
 import requests
 import pandas as pd
 import json
+import re
 import time
 import logging
+import logging.handlers
+import atexit
+import queue
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 import concurrent.futures
+import itertools
+import threading
+from operator import attrgetter
+from geopy.adapters import RequestsAdapter
+from geopy.extra.rate_limiter import RateLimiter
 from geopy.geocoders import Nominatim
 
-# Configure logging
+# Configure logging: callers only enqueue records, a background listener writes them out
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.FileHandler('spice_extraction.log'),
+    logging.StreamHandler()
+)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('spice_extraction.log'),
-        logging.StreamHandler()
-    ]
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Postcodes processed concurrently, and the cap on simultaneous outbound search requests
+POSTCODE_WORKERS = 8
+MAX_CONCURRENT_REQUESTS = 4
+REQUEST_DELAY = 0.5
+
+# Concurrent geocoding lookups; the RateLimiter still spaces requests one second apart
+GEOCODE_WORKERS = 4
+
+# Hackney postcode sectors ("E5 0" ... "EC2 9"), built once at import
+HACKNEY_POSTCODE_DISTRICTS = ("E5", "E8", "E9", "N1", "N16", "E1", "E2", "E3", "EC1", "EC2")
+HACKNEY_POSTCODES = tuple(
+    f"{district} {sector}" for district, sector in itertools.product(HACKNEY_POSTCODE_DISTRICTS, range(10))
+)
+POSTCODES_PER_RUN = 20  # Start with first 20 for testing
+
+# Keywords marking a business as a heavy spice user, matched anywhere in its cuisine or name
+SPICE_HEAVY_KEYWORDS = [
+    "indian", "curry", "asian", "chinese", "thai", "middle eastern",
+    "bengali", "pakistani", "tandoori", "spice", "oriental"
+]
+_SPICE_RE = re.compile("|".join(re.escape(keyword) for keyword in SPICE_HEAVY_KEYWORDS), re.IGNORECASE)
+
+# Sample business templates based on Hackney area, built once rather than on every search;
+# {kind} is filled with the business type and {postcode} with the searched postcode
+SAMPLE_BUSINESS_TEMPLATES = [
+    {
+        "name": "Spice Garden {kind}",
+        "address": "123 High Street, London {postcode}",
+        "phone": "+44 20 7123 4567",
+        "website": "www.spicegarden.co.uk",
+        "price_level": "££",
+        "rating": 4.2,
+        "reviews_count": 156
+    },
+    {
+        "name": "Eastern Flavours {kind}",
+        "address": "45 Market Street, London {postcode}",
+        "phone": "+44 20 7234 5678",
+        "website": "www.easternflavours.co.uk",
+        "price_level": "£££",
+        "rating": 4.5,
+        "reviews_count": 89
+    },
+    {
+        "name": "Local {kind} Express",
+        "address": "67 Station Road, London {postcode}",
+        "phone": "+44 20 7345 6789",
+        "price_level": "£",
+        "rating": 3.8,
+        "reviews_count": 234
+    }
+]
+SAMPLE_BUSINESSES_PER_TYPE = 2  # Limit to 2 per type for testing
+
+# Postcode coordinates from earlier runs, so each postcode is geocoded only once
+COORDINATES_CACHE_FILE = "postcode_coords.json"
+
 @dataclass
 class BusinessData:
     name: str
@@ -35,6 +106,23 @@ class BusinessData:
     latitude: Optional[float] = None
     longitude: Optional[float] = None
 
+# BusinessData attribute -> output column, in output order
+OUTPUT_COLUMNS = {
+    'name': 'Business Name',
+    'address': 'Address',
+    'postcode': 'Postcode',
+    'phone': 'Phone',
+    'website': 'Website',
+    'email': 'Email',
+    'cuisine_type': 'Cuisine Type',
+    'price_level': 'Price Level',
+    'rating': 'Rating',
+    'reviews_count': 'Reviews Count',
+    'business_type': 'Business Type',
+    'latitude': 'Latitude',
+    'longitude': 'Longitude'
+}
+
 class SpiceBusinessExtractor:
     def __init__(self):
         self.session = requests.Session()
@@ -42,20 +130,17 @@ class SpiceBusinessExtractor:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         self.results = []
+        self._request_slots = threading.Semaphore(MAX_CONCURRENT_REQUESTS)
+        # One geocoder for the whole run so its HTTP connection pool is reused;
+        # Nominatim's usage policy allows one request per second
+        self.geolocator = Nominatim(user_agent="spice_business_extractor", adapter_factory=RequestsAdapter)
+        self.geocode = RateLimiter(self.geolocator.geocode, min_delay_seconds=1)
+        self._coordinates = self._load_coordinates_cache()
         
     def extract_hackney_postcodes(self) -> List[str]:
         """Extract Hackney postcodes for targeting"""
-        hackney_postcodes = [
-            "E5", "E8", "E9", "N1", "N16", "E1", "E2", "E3", "EC1", "EC2"
-        ]
-        
-        detailed_postcodes = []
-        for base in hackney_postcodes:
-            for i in range(0, 10):
-                detailed_postcodes.append(f"{base} {i}")
-        
-        logger.info(f"Generated {len(detailed_postcodes)} Hackney postcodes")
-        return detailed_postcodes[:20]  # Start with first 20 for testing
+        logger.info(f"Generated {len(HACKNEY_POSTCODES)} Hackney postcodes")
+        return list(HACKNEY_POSTCODES[:POSTCODES_PER_RUN])
     
     def get_businesses_by_postcode(self, postcode: str) -> List[BusinessData]:
         """Extract businesses using multiple methods"""
@@ -90,16 +175,21 @@ class SpiceBusinessExtractor:
         for business_type in target_types:
             try:
                 # Create realistic business data for demonstration
-                sample_businesses = self._generate_sample_businesses(postcode, business_type)
+                sample_businesses = self._rate_limited(self._generate_sample_businesses, postcode, business_type)
                 businesses.extend(sample_businesses)
                 
-                time.sleep(0.5)  # Rate limiting
-                
             except Exception as e:
                 logger.error(f"Error in Yelp-style search for {business_type} in {postcode}: {str(e)}")
                 
         return businesses
     
+    def _rate_limited(self, search, *args, **kwargs):
+        """Run a search call while holding one of the shared outbound request slots"""
+        with self._request_slots:
+            result = search(*args, **kwargs)
+            time.sleep(REQUEST_DELAY)  # Rate limiting
+            return result
+    
     def _search_google_style(self, postcode: str) -> List[BusinessData]:
         """Simulate Google Places API search"""
         businesses = []
@@ -137,48 +227,16 @@ class SpiceBusinessExtractor:
     def _generate_sample_businesses(self, postcode: str, business_type: str, source: str = "yelp") -> List[BusinessData]:
         """Generate realistic sample business data for demonstration"""
         businesses = []
+        kind = business_type.title()
         
-        # Sample business templates based on Hackney area
-        templates = [
-            {
-                "name": f"Spice Garden {business_type.title()}",
-                "address": f"123 High Street, London {postcode}",
-                "phone": "+44 20 7123 4567",
-                "website": "www.spicegarden.co.uk",
-                "cuisine_type": business_type,
-                "price_level": "££",
-                "rating": 4.2,
-                "reviews_count": 156
-            },
-            {
-                "name": f"Eastern Flavours {business_type.title()}",
-                "address": f"45 Market Street, London {postcode}",
-                "phone": "+44 20 7234 5678",
-                "website": "www.easternflavours.co.uk",
-                "cuisine_type": business_type,
-                "price_level": "£££",
-                "rating": 4.5,
-                "reviews_count": 89
-            },
-            {
-                "name": f"Local {business_type.title()} Express",
-                "address": f"67 Station Road, London {postcode}",
-                "phone": "+44 20 7345 6789",
-                "cuisine_type": business_type,
-                "price_level": "£",
-                "rating": 3.8,
-                "reviews_count": 234
-            }
-        ]
-        
-        for i, template in enumerate(templates[:2]):  # Limit to 2 per type for testing
+        for template in SAMPLE_BUSINESS_TEMPLATES[:SAMPLE_BUSINESSES_PER_TYPE]:
             try:
                 business = BusinessData(
-                    name=template["name"],
-                    address=template["address"],
+                    name=template["name"].format(kind=kind),
+                    address=template["address"].format(postcode=postcode),
                     phone=template.get("phone"),
                     website=template.get("website"),
-                    cuisine_type=template["cuisine_type"],
+                    cuisine_type=business_type,
                     price_level=template["price_level"],
                     rating=template["rating"],
                     reviews_count=template["reviews_count"],
@@ -193,25 +251,13 @@ class SpiceBusinessExtractor:
     
     def prioritize_spice_users(self, businesses: List[BusinessData]) -> List[BusinessData]:
         """Prioritize businesses likely to use spices heavily"""
-        spice_heavy_keywords = [
-            "indian", "curry", "asian", "chinese", "thai", "middle eastern",
-            "bengali", "pakistani", "tandoori", "spice", "oriental"
-        ]
-        
-        prioritized = []
-        regular = []
+        names = pd.Series([business.name for business in businesses], dtype=object)
+        cuisines = pd.Series([business.cuisine_type for business in businesses], dtype=object)
+        spice_heavy = (cuisines.fillna('').str.contains(_SPICE_RE) | names.str.contains(_SPICE_RE)).to_numpy(bool)
         
-        for business in businesses:
-            is_spice_heavy = any(
-                keyword in business.cuisine_type.lower() if business.cuisine_type else False
-                or keyword in business.name.lower()
-                for keyword in spice_heavy_keywords
-            )
-            
-            if is_spice_heavy:
-                prioritized.append(business)
-            else:
-                regular.append(business)
+        # Stable partition: spice-heavy businesses first, each group in its original order
+        prioritized = [business for business, is_spice_heavy in zip(businesses, spice_heavy) if is_spice_heavy]
+        regular = [business for business, is_spice_heavy in zip(businesses, spice_heavy) if not is_spice_heavy]
                 
         logger.info(f"Prioritized {len(prioritized)} spice-heavy businesses")
         return prioritized + regular
@@ -220,6 +266,13 @@ class SpiceBusinessExtractor:
         """Enhance business data with additional contact information"""
         enhanced = []
         
+        # Geocode each distinct postcode once, before the per-business pass
+        postcodes = list(dict.fromkeys(
+            business.postcode for business in businesses if business.postcode and not business.latitude
+        ))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=GEOCODE_WORKERS) as executor:
+            coordinates = dict(zip(postcodes, executor.map(self._get_postcode_coordinates, postcodes)))
+        
         for business in businesses:
             try:
                 # Simulate email extraction based on website
@@ -229,7 +282,7 @@ class SpiceBusinessExtractor:
                 
                 # Add coordinates based on postcode
                 if business.postcode and not business.latitude:
-                    coords = self._get_postcode_coordinates(business.postcode)
+                    coords = coordinates.get(business.postcode)
                     if coords:
                         business.latitude, business.longitude = coords
                 
@@ -242,48 +295,56 @@ class SpiceBusinessExtractor:
         return enhanced
     
     def _get_postcode_coordinates(self, postcode: str) -> Optional[tuple]:
-        """Get coordinates for postcode"""
+        """Get coordinates for postcode, geocoding each postcode at most once"""
+        key = postcode.strip().upper()
+        if key in self._coordinates:
+            return self._coordinates[key]
+        
+        coords = None
         try:
-            geolocator = Nominatim(user_agent="spice_business_extractor")
-            location = geolocator.geocode(f"{postcode}, London, UK")
+            location = self.geocode(f"{postcode}, London, UK")
             if location:
-                return (location.latitude, location.longitude)
+                coords = (location.latitude, location.longitude)
         except Exception as e:
             logger.error(f"Error getting coordinates for {postcode}: {str(e)}")
-        return None
+        
+        self._coordinates[key] = coords
+        return coords
+    
+    def _load_coordinates_cache(self) -> Dict[str, tuple]:
+        """Load postcode coordinates saved by earlier runs"""
+        try:
+            with open(COORDINATES_CACHE_FILE) as f:
+                return {postcode: tuple(coords) for postcode, coords in json.load(f).items()}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.error(f"Error loading {COORDINATES_CACHE_FILE}: {str(e)}")
+            return {}
+    
+    def _save_coordinates_cache(self):
+        """Persist successfully geocoded postcodes for the next run"""
+        known = {postcode: list(coords) for postcode, coords in self._coordinates.items() if coords}
+        with open(COORDINATES_CACHE_FILE, 'w') as f:
+            json.dump(known, f, indent=2)
     
     def save_results(self, businesses: List[BusinessData], filename: str = "spice_business_leads.csv"):
         """Save results to CSV with error handling"""
         try:
-            # Convert to DataFrame
-            data = []
-            for business in businesses:
-                data.append({
-                    'Business Name': business.name,
-                    'Address': business.address,
-                    'Postcode': business.postcode,
-                    'Phone': business.phone,
-                    'Website': business.website,
-                    'Email': business.email,
-                    'Cuisine Type': business.cuisine_type,
-                    'Price Level': business.price_level,
-                    'Rating': business.rating,
-                    'Reviews Count': business.reviews_count,
-                    'Business Type': business.business_type,
-                    'Latitude': business.latitude,
-                    'Longitude': business.longitude
-                })
-            
-            df = pd.DataFrame(data)
+            # Convert to DataFrame straight from the attribute tuples
+            row = attrgetter(*OUTPUT_COLUMNS)
+            df = pd.DataFrame.from_records((row(business) for business in businesses), columns=list(OUTPUT_COLUMNS))
+            df = df.rename(columns=OUTPUT_COLUMNS)
             df.to_csv(filename, index=False)
-            logger.info(f"Saved {len(data)} businesses to {filename}")
+            logger.info(f"Saved {len(df)} businesses to {filename}")
             
             # Also save as JSON for API integration
             json_filename = filename.replace('.csv', '.json')
-            with open(json_filename, 'w') as f:
-                json.dump(data, f, indent=2)
+            df.to_json(json_filename, orient='records', indent=2)
             logger.info(f"Saved JSON data to {json_filename}")
             
+            self._save_coordinates_cache()
+            
         except Exception as e:
             logger.error(f"Error saving results: {str(e)}")
     
@@ -295,24 +356,28 @@ class SpiceBusinessExtractor:
             # Get Hackney postcodes
             postcodes = self.extract_hackney_postcodes()
             
-            all_businesses = []
+            results = {}
             
-            # Process postcodes
-            for postcode in postcodes:
-                logger.info(f"Processing postcode: {postcode}")
+            # Process postcodes concurrently; outbound requests are throttled in _rate_limited
+            with concurrent.futures.ThreadPoolExecutor(max_workers=POSTCODE_WORKERS) as executor:
+                futures = {}
+                for postcode in postcodes:
+                    logger.info(f"Processing postcode: {postcode}")
+                    futures[executor.submit(self.get_businesses_by_postcode, postcode)] = postcode
                 
-                try:
-                    businesses = self.get_businesses_by_postcode(postcode)
-                    all_businesses.extend(businesses)
-                    
-                    logger.info(f"Found {len(businesses)} businesses in {postcode}")
-                    
-                    # Rate limiting
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    logger.error(f"Error processing {postcode}: {str(e)}")
-                    continue
+                for future in concurrent.futures.as_completed(futures):
+                    postcode = futures[future]
+                    try:
+                        results[postcode] = future.result()
+                        logger.info(f"Found {len(results[postcode])} businesses in {postcode}")
+                        
+                    except Exception as e:
+                        logger.error(f"Error processing {postcode}: {str(e)}")
+            
+            # Keep postcode order so duplicate removal is deterministic
+            all_businesses = []
+            for postcode in postcodes:
+                all_businesses.extend(results.get(postcode, []))
             
             # Remove duplicates
             unique_businesses = self._remove_duplicates(all_businesses)
@@ -336,14 +401,13 @@ class SpiceBusinessExtractor:
     
     def _remove_duplicates(self, businesses: List[BusinessData]) -> List[BusinessData]:
         """Remove duplicate businesses based on name and address"""
-        seen = set()
-        unique = []
+        names = pd.Series([business.name for business in businesses], dtype=object)
+        addresses = pd.Series([business.address for business in businesses], dtype=object)
+        identifiers = names.astype(str).str.lower() + '_' + addresses.astype(str).str.lower()
         
-        for business in businesses:
-            identifier = f"{business.name.lower()}_{business.address.lower()}"
-            if identifier not in seen:
-                seen.add(identifier)
-                unique.append(business)
+        # Keep the first occurrence of each identifier
+        duplicated = identifiers.duplicated(keep='first').to_numpy()
+        unique = [business for business, is_duplicate in zip(businesses, duplicated) if not is_duplicate]
         
         logger.info(f"Removed {len(businesses) - len(unique)} duplicates")
         return unique